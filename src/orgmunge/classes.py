@@ -4,15 +4,49 @@ import re
 from typing import Optional, List, Union, Tuple, Dict
 from datetime import datetime as dt
 from datetime import timedelta
-from functools import reduce
-from operator import add
-from math import floor
+from functools import lru_cache
+from itertools import chain
 from .lexer import Lexer 
 
 ORG_TIME_FORMAT_NO_TIME = '%Y-%m-%d %a'
 ORG_TIME_FORMAT = ORG_TIME_FORMAT_NO_TIME + ' %H:%M'
 
+# Patterns used while building the classes below are compiled once at import
+# time since they're hit for every cookie, timestamp, drawer, etc... in a file.
+_PCT_CAP = re.compile(r'\[(.+)%\]')
+_PROG_CAP = re.compile(r'\[(.*)/(.*)\]')
+_PRI_RE = re.compile(r'^\[#(.)\]')
+_ATIMESTAMP_RE = re.compile(Lexer.ATIMESTAMP)
+_ITIMESTAMP_RE = re.compile(Lexer.ITIMESTAMP)
+_TIMESTAMP_RE = re.compile(fr'{Lexer.ATIMESTAMP}|{Lexer.ITIMESTAMP}')
+_LEADING_DASH = re.compile(r'^-')
+_REPEATER_RE = re.compile(r'^[.+]?\+[0-9]+[hdwmy]')
+_WARN_RE = re.compile(r'^-[0-9]+[hdwmy]')
+_TRAIL_COLON = re.compile(r':\s*$')
+_CLOCK_LINE_RE = re.compile(fr'CLOCK:\s*(?P<start>{Lexer.ITIMESTAMP})(?:--(?P<end>{Lexer.ITIMESTAMP}))?')
+_CLOCK_PREFIX_RE = re.compile(r'^\s*CLOCK:')
+_BRACKETS = re.compile(r'[\[\]]')
+_PROP_RE = re.compile(r':([^:]+):\s*(.*)')
+
+_DAYS_OF_WEEK = frozenset(('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'))
+
+@lru_cache(maxsize=4096)
+def _parse_org_ts(s: str, with_time: bool = True) -> dt:
+    """Equivalent of dt.strptime(s, ORG_TIME_FORMAT) (or ORG_TIME_FORMAT_NO_TIME
+    if with_time is False). Timestamps in the canonical org shape (YYYY-MM-DD Day HH:MM)
+    have their fields sliced out directly; anything else is left to strptime."""
+    s = s.strip()
+    if (len(s) == (20 if with_time else 14) and s[4] == '-' and s[7] == '-' and s[10] == ' '
+            and s[11:14] in _DAYS_OF_WEEK and (s[0:4] + s[5:7] + s[8:10]).isdigit()):
+        if not with_time:
+            return dt(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+        if s[14] == ' ' and s[17] == ':' and (s[15:17] + s[18:20]).isdigit():
+            return dt(int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[15:17]), int(s[18:20]))
+    return dt.strptime(s, ORG_TIME_FORMAT if with_time else ORG_TIME_FORMAT_NO_TIME)
+
 class Cookie:
+    __slots__ = ('_cookie_type', '_m', '_n')
+
     def __init__(self, text: str):
         """Cookies can be of type 'precent' (e.g. [5%])
         or 'progress' (e.g. [2/3]). Both types store
@@ -20,28 +54,25 @@ class Cookie:
         and n is the total number. In the case of a perecent-type Cookie
         n is set to 100.
         """
-        if re.search(r'%', text):
+        if '%' in text:
             self._cookie_type = 'percent'
-            match = re.search(r'\[(.+)%\]', text)
-            if match:
-                self._m = int(match.group(1))
-                if self._m > 100:
-                    raise ValueError(f'Meaningless cookie value: {m}%')
-            else:
-                self._m = 0
-            self._n = 100
-        elif re.search(r'/', text):
+            match = _PCT_CAP.search(text)
+            m = int(match.group(1)) if match else 0
+            n = 100
+            if m > n:
+                raise ValueError(f'Meaningless cookie value: {m}%')
+        elif '/' in text:
             self._cookie_type = 'progress'
-            match = re.search(r'\[(.*)/(.*)\]', text)
-            m = int(match.group(1)) if match.group(1) != '' else 0
-            n = int(match.group(2)) if match.group(2) != '' else 0
-            self._m, self._n = m, n
+            match = _PROG_CAP.search(text)
+            a, b = match.group(1), match.group(2)
+            m = int(a) if a else 0
+            n = int(b) if b else 0
+            if m > n:
+                raise ValueError(f'Meaningless cookie value: {m}/{n}')
         else:
             self._cookie_type = None
-            self._m = 0
-            self._n = 0
-        if self._m > self._n:
-            raise ValueError(f'Meaningless cookie value: {m}/{n}')
+            m, n = 0, 0
+        self._m, self._n = m, n
 
     @property
     def cookie_type(self):
@@ -95,9 +126,13 @@ class Cookie:
         else:
             return str(self) == str(other)
 class Priority:
+    __slots__ = ('_priority',)
     allowed_values = ['A', 'B', 'C']
+    _allowed_set = frozenset(allowed_values)
+    _next = dict(zip(allowed_values, allowed_values[1:] + allowed_values[:1]))
+    _prev = dict(zip(allowed_values, allowed_values[-1:] + allowed_values[:-1]))
     def _parse_priority(self, p: str):
-        match = re.search(r"^\[#(.)\]", p)
+        match = _PRI_RE.search(p)
         return match.group(1) if match else p
 
     def __init__(self, priority_text: Optional[str]):
@@ -110,7 +145,7 @@ class Priority:
 
     @priority.setter
     def priority(self, value: Optional[str]):
-        if value in self.allowed_values or value is None: # Allow None to remove priority
+        if value is None or value in self._allowed_set: # Allow None to remove priority
             self._priority = value
         else:
             raise ValueError(f"Priority must be one of {self.allowed_values}; {value} passed")
@@ -118,14 +153,12 @@ class Priority:
     def _raise(self):
         if self.priority is None:
             self.priority = self.allowed_values[0]
-        idx = self.allowed_values.index(self.priority)
-        self.priority = self.allowed_values[(idx + 1) % len(self.allowed_values)]
+        self.priority = self._next[self.priority]
 
     def _lower(self):
         if self.priority is None:
             self.priority = self.allowed_values[-1]
-        idx = self.allowed_values.index(self.priority)
-        self.priority = self.allowed_values[(idx - 1) % len(self.allowed_values)]
+        self.priority = self._prev[self.priority]
 
     def __repr__(self):
         return f'[#{self.priority}]' if self.priority is not None else ''
@@ -137,19 +170,38 @@ class Priority:
             return str(self) == str(other)
 
 class Headline:
+    __slots__ = ('_level', '_stars', '_comment', '_todo', '_priority', 'title', '_cookie', 'tags',
+                 '_todo_states', '_done_states', '_all_states', '_todo_keywords')
+    # The todos mapping last passed to the constructor and the state sets derived from it.
+    # All the headlines of a parsed file share the same mapping, so this avoids rebuilding
+    # identical sets for every one of them.
+    _todos_cache = (None, None)
+
+    @classmethod
+    def _get_todo_states(cls, todos: Dict[str, Dict[str, str]]):
+        cached_todos, states = cls._todos_cache
+        if cached_todos is not todos:
+            todo_states = frozenset(todos['todo_states'].values())
+            done_states = frozenset(todos['done_states'].values())
+            states = (todo_states, done_states, todo_states | done_states,
+                      {**todos['todo_states'], **todos['done_states']})
+            cls._todos_cache = (todos, states)
+        return states
+
     def __init__(self, todos, level: str, comment: bool = False,
                todo: Optional[str] = None, priority: Optional[str] = None,
                title: str = "", cookie: Optional[str] = None, tags: Optional[List[str]] = None):
-        self._level = len(re.sub(r'\s+', '', level)) # Number of leading asterisks
+        self._level = level.count('*') # Number of leading asterisks
+        self._stars = '*' * self._level
         self._comment = comment
         self._todo = todo
         self._priority = Priority(priority)
         self.title = title
         self._cookie = cookie if cookie is None else Cookie(cookie)
         self.tags = tags
-        self._todo_states = list(todos['todo_states'].values())
-        self._done_states = list(todos['done_states'].values())
-        self._todo_keywords = {**todos['todo_states'], **todos['done_states']}
+        (self._todo_states, self._done_states,
+         self._all_states, self._todo_keywords) = self._get_todo_states(todos)
+
     @property
     def done(self):
         return self._is_done()
@@ -159,9 +211,9 @@ class Headline:
         raise AttributeError("Can't set the 'done' attribute")
 
     def _is_done(self):
-        if self.todo in self._done_states:
+        if self._todo in self._done_states:
             return True
-        elif self.todo is None or self.todo in self._todo_states:
+        elif self._todo is None or self._todo in self._todo_states:
             return False
         else:
             raise ValueError(f"Uncategorized todo state {self.todo}")
@@ -175,6 +227,7 @@ class Headline:
         if not isinstance(value, int):
             raise ValueError(f"Can only set headline level to an integer value, {value} passed.")
         self._level = value
+        self._stars = '*' * value
 
     def promote(self, n: int = 1):
         level = self.level - n
@@ -208,9 +261,8 @@ class Headline:
 
     @todo.setter
     def todo(self, value: Optional[str]):
-        if value not in self._todo_states and value not in self._done_states and value is not None:
-            possible_states = set.union(self._todo_states, self._done_states)
-            raise ValueError(f"Todo keyword has to be one of {','.join(possible_states)} or None, {value} passed.")
+        if value is not None and value not in self._all_states:
+            raise ValueError(f"Todo keyword has to be one of {','.join(sorted(self._all_states))} or None, {value} passed.")
         else:
             self._todo = value
 
@@ -240,12 +292,19 @@ class Headline:
         self._priority = Priority(value)
 
     def __repr__(self):
-        priority = f'{self.priority}' + (' ' if str(self.priority) != '' else '')
-        comment = "COMMENT " if self.comment else ""
-        todo = f"{self.todo} " if self.todo else ""
-        cookie = ' ' + str(self.cookie) if self.cookie else ""
-        tags = f"    :{':'.join(self.tags)}:" if self.tags else ""
-        return f"{'*' * self.level} {todo}{comment}{priority}{self.title}{cookie}{tags}"
+        parts = [self._stars, ' ']
+        if self._todo:
+            parts += [self._todo, ' ']
+        if self._comment:
+            parts.append('COMMENT ')
+        if self._priority.priority is not None:
+            parts += [repr(self._priority), ' ']
+        parts.append(self.title)
+        if self._cookie:
+            parts += [' ', repr(self._cookie)]
+        if self.tags:
+            parts += ['    :', ':'.join(self.tags), ':']
+        return ''.join(parts)
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -254,40 +313,52 @@ class Headline:
             return str(self) == str(other)
 
 class TimeStamp:
+    __slots__ = ('_active', '_start_time', '_end_time', '_repeater', '_deadline_warn', '_dt_format',
+                 '_repr_cache')
+
     def __init__(self, timestamp_str: str):
-        is_active = re.search(Lexer.ATIMESTAMP, timestamp_str)
-        is_inactive = re.search(Lexer.ITIMESTAMP, timestamp_str)
+        is_active = _ATIMESTAMP_RE.search(timestamp_str)
+        is_inactive = _ITIMESTAMP_RE.search(timestamp_str)
         self._active = True if is_active else False
         match = is_active if self._active else is_inactive
         date, day_of_week, start_time, end_time, repeater, deadline_warn = match.groups()
         self._start_time = self._to_datetime([date, day_of_week, start_time])
         if end_time:
-            end_time = re.sub(r'^-', '', end_time)
+            end_time = _LEADING_DASH.sub('', end_time)
             self._end_time = self._to_datetime([date, day_of_week, end_time]) 
         else:
             self._end_time = None
         self._repeater = repeater
         self._deadline_warn = deadline_warn
+        self._repr_cache = None
 
     def _to_datetime(self, date_components: List[str]) -> dt:
-        if date_components[-1] is None:
-            dt_format = ORG_TIME_FORMAT_NO_TIME
+        with_time = date_components[-1] is not None
+        if not with_time:
             date_components = date_components[:-1]
-        else:
-            dt_format = ORG_TIME_FORMAT
-        self._dt_format = dt_format
-        return dt.strptime(' '.join(date_components), dt_format)
+        self._dt_format = ORG_TIME_FORMAT if with_time else ORG_TIME_FORMAT_NO_TIME
+        return _parse_org_ts(' '.join(c.strip() for c in date_components), with_time)
+
+    def _replace_time(self, date: dt, value: str) -> dt:
+        """Return date with its time of day set from value, given as HH:MM."""
+        value = value.strip()
+        if len(value) == 5 and value[2] == ':' and (value[:2] + value[3:]).isdigit():
+            return date.replace(hour=int(value[:2]), minute=int(value[3:]))
+        t = dt.strptime(value, '%H:%M')
+        return date.replace(hour=t.hour, minute=t.minute)
+
     @property
     def start_time(self):
         return self._start_time
 
     @start_time.setter
     def start_time(self, value: Union[str, dt, None]):
+        self._repr_cache = None
         if value is None:
             self._start_time = self.start_time.strftime(ORG_TIME_FORMAT_NO_TIME)
             t = None
         elif isinstance(value, str):
-            t = dt.strptime(' '.join([self.start_time.strftime(ORG_TIME_FORMAT_NO_TIME), value]), ORG_TIME_FORMAT)
+            t = self._replace_time(self.start_time, value)
         elif isinstance(value, dt):
             if self.end_time and (value.year != self.end_time.year or value.month != self.end_time.month or value.day != self.end_time.day):
                 raise ValueError('The start time for a timestamp must have the same date as the end time')
@@ -307,6 +378,7 @@ class TimeStamp:
     @active.setter
     def active(self, value: bool):
         if isinstance(value, bool):
+            self._repr_cache = None
             self._active = value
         else:
             raise TypeError("The active property of timestamps needs to be a Boolean.")
@@ -317,11 +389,12 @@ class TimeStamp:
 
     @end_time.setter
     def end_time(self, value: Union[str, dt, None]):
+        self._repr_cache = None
         if value is None:
             self._end_time = None
             t = None
         elif isinstance(value, str):
-            t = dt.strptime(' '.join([self.end_time.strftime(ORG_TIME_FORMAT_NO_TIME), value]), ORG_TIME_FORMAT)
+            t = self._replace_time(self.end_time, value)
         elif isinstance(value, dt):
             if value.year != self.start_time.year or value.month != self.start_time.month or value.day != self.start_time.day:
                 raise ValueError('The end time for a timestamp must have the same date as the start time')
@@ -340,9 +413,10 @@ class TimeStamp:
 
     @repeater.setter
     def repeater(self, value: Optional[str]):
+        self._repr_cache = None
         if value is None:
             self._repeater = None
-        elif re.search(r'^[.+]?\+[0-9]+[hdwmy]', value):
+        elif _REPEATER_RE.search(value):
             self._repeater = value
         else:
             raise ValueError(f"Repeaters must start with .+, ++ or +, followed by an integer and one of h, d, w, m or y. Can't work with {value}.")
@@ -353,13 +427,16 @@ class TimeStamp:
 
     @deadline_warn.setter
     def deadline_warn(self, value: Optional[str]):
+        self._repr_cache = None
         if value is None:
             self._deadline_warn = None
-        elif re.search(r'^-[0-9]+[hdwmy]', value):
+        elif _WARN_RE.search(value):
             self._deadline_warn = value
         else:
             raise ValueError(f"Special deadline warnings must start with -, followed by an integer and one of h, d, w, m or y. Can't work with {value}.")
     def __repr__(self):
+        if self._repr_cache is not None:
+            return self._repr_cache
         ldelim = '<' if self.active else '['
         rdelim = '>' if self.active else ']'
         timestamp = self.start_time.strftime(self._dt_format)
@@ -369,7 +446,8 @@ class TimeStamp:
             timestamp += f'{self.repeater}'    
         if self.deadline_warn:
             timestamp += f'{self.deadline_warn}'
-        return ldelim + timestamp + rdelim
+        self._repr_cache = ldelim + timestamp + rdelim
+        return self._repr_cache
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -378,9 +456,7 @@ class TimeStamp:
             return str(self) == str(other)
 
 class Scheduling:
-    _closed = None
-    _scheduled = None
-    _deadline = None
+    __slots__ = ('_closed', '_scheduled', '_deadline')
 
     # Helper class to group together common getter and setter code for all keywords
     class Keyword:
@@ -406,10 +482,11 @@ class Scheduling:
                 setattr(obj, self.attr, value)
             else:
                 raise TypeError(f"The timestamp value for a Scheduling keyword must be an instance of the TimeStamp class.")
-    valid_keywords = ['closed', 'scheduled', 'deadline']
+    valid_keywords = ('closed', 'scheduled', 'deadline')
     def __init__(self, keyword: Optional[str] = None, timestamp: Optional[TimeStamp] = None):
+        self._closed = self._scheduled = self._deadline = None
         if keyword is not None and timestamp is not None:
-            canonical_keyword = re.sub(r':\s*$', '', keyword).lower()
+            canonical_keyword = _TRAIL_COLON.sub('', keyword).lower()
             if canonical_keyword not in self.valid_keywords:
                 raise ValueError(f'Scheduling keyword must be one of {self.valid_keywords}, got {canonical_keyword}')
             else:
@@ -420,14 +497,13 @@ class Scheduling:
 
     # Define this so the parser can add together multiple scheduling keywords:
     def __add__(self, other):
+        result = Scheduling()
         for keyword in self.valid_keywords:
-            if getattr(self, keyword) and getattr(other, keyword):
-                raise ValueError(f"Can't merge two Scheduling types when both of them have the {keyword} property set.") 
-            else:
-                result = Scheduling()
-                for keyword in self.valid_keywords:
-                    setattr(result, keyword, getattr(self, keyword) or getattr(other, keyword) or None)
-                return result
+            a, b = getattr(self, keyword), getattr(other, keyword)
+            if a and b:
+                raise ValueError(f"Can't merge two Scheduling types when both of them have the {keyword} property set.")
+            setattr(result, keyword, a or b)
+        return result
 
     CLOSED = closed = Keyword('closed')
     SCHEDULED = scheduled = Keyword('scheduled')
@@ -444,9 +520,12 @@ class Scheduling:
             return str(self) == str(other)
 
 class Drawer:
+    __slots__ = ('name', 'contents')
+
     def __init__(self, drawer_string: str):
-        self.name = re.sub(r':', '', drawer_string.split('\n')[0])
-        self.contents = drawer_string.strip().split('\n')[1:-1]
+        lines = drawer_string.strip().split('\n')
+        self.name = lines[0].replace(':', '')
+        self.contents = lines[1:-1]
     def __repr__(self):
         contents = "\n".join(self.contents)
         return f''':{self.name}:
@@ -460,18 +539,22 @@ class Drawer:
             return str(self) == str(other)
         
 class Clocking:
+    __slots__ = ('_start_time', '_end_time', '_duration', '_repr_cache')
+
     def __init__(self, start_time: str, end_time: Optional[str] = None):
-        self._start_time = dt.strptime(start_time, ORG_TIME_FORMAT)
+        self._start_time = _parse_org_ts(start_time)
         if end_time is not None:
-            self._end_time = dt.strptime(end_time, ORG_TIME_FORMAT)
+            self._end_time = _parse_org_ts(end_time)
         else:
             self._end_time = None
         self._duration = None
+        self._repr_cache = None
 
     def _set_time(self, property: str, value: str):
         try:
-            datetime_obj = dt.strptime(value, ORG_TIME_FORMAT)
+            datetime_obj = _parse_org_ts(value)
             setattr(self, property, datetime_obj)
+            self._repr_cache = None
         except ValueError:
             raise ValueError(f"Time string {value} doesn't match expected org time format {ORG_TIME_FORMAT}")
 
@@ -491,17 +574,16 @@ class Clocking:
     def end_time(self, value: Optional[str]):
         if value is None:
             self._end_time = value
+            self._repr_cache = None
         else:
             self._set_time('_end_time', value)
         
     def _display_delta(self, time_delta: timedelta) -> str:
-        total_seconds = time_delta.total_seconds()
-        if total_seconds < 0:
-            return f'-{self._display_delta(timedelta(seconds=-total_seconds))}'
-        m, s = total_seconds/60, total_seconds%60
-        if s > 30: m += 1 # Round minutes up
-        h, m = m/60, m%60
-        hours, minutes = [floor(x) for x in (h, m)]
+        if time_delta < timedelta(0):
+            return f'-{self._display_delta(-time_delta)}'
+        minutes, seconds = divmod(time_delta.days * 86400 + time_delta.seconds, 60)
+        if seconds > 30 or (seconds == 30 and time_delta.microseconds): minutes += 1 # Round minutes up
+        hours, minutes = divmod(minutes, 60)
         return f'{hours}:{minutes:02d}'
 
     @property
@@ -518,8 +600,10 @@ class Clocking:
     def __repr__(self):
         if self.end_time is None:
             return f'[{self.start_time.strftime(ORG_TIME_FORMAT)}]'
-        else:
-            return f'[{self.start_time.strftime(ORG_TIME_FORMAT)}]--[{self.end_time.strftime(ORG_TIME_FORMAT)}] =>  {self.duration}'
+        # Closed clockings don't depend on the current time so their representation can be cached
+        if self._repr_cache is None:
+            self._repr_cache = f'[{self.start_time.strftime(ORG_TIME_FORMAT)}]--[{self.end_time.strftime(ORG_TIME_FORMAT)}] =>  {self.duration}'
+        return self._repr_cache
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -528,20 +612,25 @@ class Clocking:
             return str(self) == str(other)
 
 class Heading():
+    __slots__ = ('_headline', '_scheduling', '_drawers', 'body', 'timestamps', '_properties',
+                 '_children', '_child_index', '_parent', '_sibling', '_props_key', '_props_drawer',
+                 '_props_lines')
+
     def __init__(self, headline: Headline, contents: Tuple[Scheduling, List[Drawer], str]):
         self._headline = headline
         self._scheduling, self._drawers, self.body = contents
         self._children = []
+        self._child_index = {}
         self._parent = None
         self._sibling = None
+        self._props_key = None
+        self._props_drawer = None
+        self._props_lines = None
         if self.body:
-            self.timestamps = [TimeStamp(t[0]) for t in re.findall(fr'({Lexer.ATIMESTAMP}|{Lexer.ITIMESTAMP})', self.body)]
-        if self._drawers:
-            properties_drawer = [d for d in self._drawers if d.name == 'PROPERTIES']
-            if properties_drawer:
-                self._properties = self._get_properties_dict(properties_drawer[0].contents)
-            else:
-                self._properties = dict()
+            self.timestamps = [TimeStamp(m.group(0)) for m in _TIMESTAMP_RE.finditer(self.body)]
+        properties_drawer = self._find_drawer(self._drawers, 'PROPERTIES')
+        if properties_drawer:
+            self._properties = self._get_properties_dict(properties_drawer.contents)
         else:
             self._properties = dict()
 
@@ -553,11 +642,11 @@ class Heading():
             raise AttributeError(f'Heading class has no attribute {attr}')
 
     def _parse_clock_line(self, line: str) -> Clocking:
-        m = re.search(fr'CLOCK:\s*(?P<start>{Lexer.ITIMESTAMP})(?:--(?P<end>{Lexer.ITIMESTAMP}))?', line)
+        m = _CLOCK_LINE_RE.search(line)
         if m is not None:
-            start_time = re.sub(r'[\[\]]', '', m.group("start"))
+            start_time = _BRACKETS.sub('', m.group("start"))
             if m.group("end"):
-                end_time = re.sub(r'[\[\]]', '', m.group("end"))
+                end_time = _BRACKETS.sub('', m.group("end"))
             else:
                 end_time = None
         else:
@@ -569,16 +658,32 @@ class Heading():
             return []
         logbook = self.get_drawer_by_name('LOGBOOK')
         if logbook:
-            return [self._parse_clock_line(l) for l in logbook.contents if re.search(r'^\s*CLOCK:', l)]
+            return [self._parse_clock_line(l) for l in logbook.contents if _CLOCK_PREFIX_RE.search(l)]
         else:
             return []
 
     def _get_properties_dict(self, contents: List[str]) -> Dict[str, str]:
-        return {k: v for (k, v) in [re.search(r':([^:]+):\s+(.*)', line).groups()
-                                    for line in contents]} 
+        # Lines that don't look like properties are skipped
+        return {m.group(1): m.group(2) for line in contents if (m := _PROP_RE.search(line))}
 
     def _get_properties_string(self) -> str:
-        return "\n".join([f":{k}:{' '*7}{v}" for k, v in self.properties.items()])
+        return "\n".join([f":{k}:{' '*7}{v}" if v != '' else f":{k}:" for k, v in self.properties.items()])
+
+    def _get_properties_drawer(self) -> Drawer:
+        """Return a PROPERTIES drawer reflecting the current properties. The drawer is
+        only rebuilt when the properties have changed since the last call (including
+        in-place changes to the dict returned by the properties getter) or when the
+        drawer itself was modified, since the properties always take precedence."""
+        key = tuple(self._properties.items())
+        drawer = self._props_drawer
+        if (key != self._props_key or drawer.name != 'PROPERTIES'
+                or drawer.contents != self._props_lines):
+            self._props_key = key
+            self._props_drawer = Drawer(f""":PROPERTIES:
+{self._get_properties_string()}
+:END:""")
+            self._props_lines = list(self._props_drawer.contents)
+        return self._props_drawer
 
     @property
     def properties(self):
@@ -596,17 +701,21 @@ class Heading():
     def clocking(self, include_children: bool = False) -> List[Clocking]:
         "Return the clocking information of the given headline and possibly its children."
         own_clocking = self._get_clocking_info()
-        if include_children and self.children != []:
-            return own_clocking + reduce(add, [c.clocking(include_children=True) for c in self.children])
+        if include_children and self.children:
+            return own_clocking + list(chain.from_iterable(c.clocking(include_children=True) for c in self.children))
         else:
             return own_clocking
 
+    @staticmethod
+    def _find_drawer(drawers: Optional[List[Drawer]], name: str) -> Optional[Drawer]:
+        # Headings only have a handful of drawers, and their names and the list itself
+        # can be changed by the user at any time, so a plain scan is used.
+        return next((d for d in drawers or [] if d.name == name), None)
+
     def get_drawer_by_name(self, name: str) -> Optional[Drawer]:
         "Return the named drawer if it exists, or None if it doesn't"
-        try:
-            return next(d for d in self.drawers if d.name == name)
-        except StopIteration:
-            return None
+        drawers = self.drawers # Also brings the PROPERTIES drawer up to date
+        return self._find_drawer(drawers, name)
 
     @property
     def headline(self):
@@ -634,14 +743,13 @@ class Heading():
 
     @property
     def drawers(self):
-        updated_properties_drawer = Drawer(f""":PROPERTIES:
-{self._get_properties_string()}
-:END:""") 
         if self._drawers:
             if self._drawers[0].name == 'PROPERTIES':
-                self._drawers = [updated_properties_drawer] + self._drawers[1:]
+                properties_drawer = self._get_properties_drawer()
+                if self._drawers[0] is not properties_drawer:
+                    self._drawers = [properties_drawer] + self._drawers[1:]
         elif self.properties:
-            self._drawers = [updated_properties_drawer]
+            self._drawers = [self._get_properties_drawer()]
         return self._drawers
 
     @drawers.setter
@@ -669,6 +777,20 @@ class Heading():
                 raise TypeError(f"Child headings must all be of type {Heading}. Found these value types instead: {' '.join(types)}.")
             else:
                 self._children = value
+        self._child_index = {}
+
+    def _index_of_child(self, child) -> int:
+        """Return the position of child in this heading's children. The positions are
+        cached by id and the cache is rebuilt whenever it's found to be out of date
+        (e.g. after the children list was modified in place)."""
+        children = self._children or []
+        idx = self._child_index.get(id(child))
+        if idx is None or idx >= len(children) or children[idx] is not child:
+            self._child_index = {id(c): i for i, c in enumerate(children)}
+            idx = self._child_index.get(id(child))
+            if idx is None:
+                raise ValueError(f"{child.headline} is not a child of {self.headline}")
+        return idx
 
     def add_child(self, heading, new: bool = False):
         heading.parent = self
@@ -676,6 +798,7 @@ class Heading():
             raise TypeError(f"Child heading must be of type {Heading}. Can't work with {type(heading)}!")
         if new:
             if self.children:
+                self._child_index[id(heading)] = len(self.children)
                 self.children.append(heading)
             else:
                 self.children = [heading]
@@ -684,12 +807,14 @@ class Heading():
             if self.children:
                 if heading.sibling:
                     try:
-                        idx = self.children.index(heading.sibling) 
-                        self.children = self.children[:idx + 1] + [heading] + self.children[idx+1:]
+                        idx = self._index_of_child(heading.sibling)
                     except ValueError:
                         raise ValueError("Incorrect promotion: grandparent doesn't have original parent in children!")
+                    self._children.insert(idx + 1, heading)
+                    if idx + 2 < len(self._children):
+                        self._children[idx + 2].sibling = heading
                 else: # This is the case where a heading that's been demoted needs to be adopted by its sibling
-                    self.children = [heading] + self.children    
+                    self._children.insert(0, heading)
             else:
                 self.children = [heading]
 
@@ -731,12 +856,17 @@ class Heading():
     def level(self, value: int):
         self.headline.level = value
 
+    def _check_promotable(self):
+        if self.parent is None or self.parent.parent is None:
+            raise ValueError('Incorrect promotion: heading is already at the top level.')
+
     def promote(self):
+        self._check_promotable()
         if self.children:
             raise ValueError('Incorrect promotion: heading has children that would be orphaned. Did you mean promote_tree?')
         self.headline.promote()
         self.sibling = self.parent
-        idx = self.sibling.children.index(self)
+        idx = self.sibling._index_of_child(self)
         next_siblings = self.sibling.children[idx + 1:]
         if next_siblings:
             next_siblings[0].sibling = None
@@ -749,17 +879,29 @@ class Heading():
         self.sibling.parent.add_child(self)
         
     def promote_tree(self):
+        # Detach the subtree so the heading itself can be promoted, then put it back in
+        # front of any following siblings the promotion made into children.
+        self._check_promotable()
         children = self.children
+        self.children = []
         self.promote()
         if children:
-            for child in children:
-                child.promote_tree()
+            adopted = self.children
+            if adopted:
+                adopted[0].sibling = children[-1]
+            self.children = children + adopted
+            stack = list(children)
+            while stack:
+                heading = stack.pop()
+                heading.headline.promote()
+                if heading.children:
+                    stack.extend(heading.children)
 
     def demote(self):
         if not self.sibling:
             raise ValueError('Incorrect demotion: heading has no sibling to adopt it.')
         self.headline.demote()
-        idx = self.parent.children.index(self)
+        idx = self.parent._index_of_child(self)
         try:
             next_sibling = self.parent.children[idx + 1]
             next_sibling.sibling = self.sibling
@@ -779,11 +921,14 @@ class Heading():
         self.children = None
 
     def demote_tree(self):
-        children = self.children
-        self.demote()
-        if children:
-            for child in children:
-                child.demote_tree()
+        stack = [self]
+        while stack:
+            heading = stack.pop()
+            children = heading.children
+            heading.demote()
+            if children:
+                # Reversed so that children are demoted in document order
+                stack.extend(reversed(children))
 
     def __repr__(self):
         scheduling = str(self.scheduling) + "\n" if self.scheduling else ""
@@ -1,3 +1,4 @@
+import pytest
 from orgmunge import Org
 from orgmunge.classes import Headline, Cookie
 
@@ -38,3 +39,10 @@ def test_todos_from_file():
                                                         tags=None,)
     assert parsed.root.children[0].done == False
     assert parsed.root.children[1].done == True
+
+def test_invalid_todo():
+    parsed = Org('* NEXT Some task\n', from_file=False,
+                 todos = {'todo_states': {'next': 'NEXT'},
+                          'done_states': {'done': 'DONE'}})
+    with pytest.raises(ValueError, match='DONE,NEXT or None, FOO passed'):
+        parsed.root.children[0].headline.todo = 'FOO'
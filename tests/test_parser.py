@@ -1,3 +1,4 @@
+import pytest
 from orgmunge import Org
 from orgmunge.classes import *
 from itertools import product
@@ -53,3 +54,58 @@ CLOCK: [2023-07-23 Sun 10:00]--[2023-07-23 Sun 12:00] => 2:00
     assert main_heading.title == main_heading.headline.title
     
 
+def test_merging_scheduling():
+    scheduled = Scheduling('SCHEDULED:', TimeStamp('<2023-07-23 Sun>'))
+    deadline = Scheduling('DEADLINE:', TimeStamp('<2023-07-24 Mon>'))
+    merged = scheduled + deadline
+    assert str(merged) == 'SCHEDULED: <2023-07-23 Sun> DEADLINE: <2023-07-24 Mon>'
+    with pytest.raises(ValueError):
+        merged + Scheduling('DEADLINE:', TimeStamp('<2023-07-25 Tue>'))
+
+def test_clocking_time_formats():
+    assert Clocking('2023-07-23 Sun 9:05').start_time == Clocking('2023-07-23 Sun 09:05').start_time
+    with pytest.raises(ValueError):
+        Clocking('2023-07-23 Xyz 09:05')
+
+def test_setting_timestamp_time():
+    timestamp = TimeStamp('<2023-07-23 Sun 14:00>')
+    timestamp.start_time = '9:05'
+    assert str(timestamp) == '<2023-07-23 Sun 09:05>'
+    with pytest.raises(ValueError):
+        timestamp.start_time = '25:00'
+
+def test_renamed_drawer():
+    parsed = Org('''* Heading
+:LOGBOOK:
+CLOCK: [2023-07-23 Sun 10:00]--[2023-07-23 Sun 12:00] => 2:00
+:END:
+''', from_file=False)
+    heading = parsed.root.children[0]
+    heading.get_drawer_by_name('LOGBOOK').name = 'NOTES'
+    assert heading.get_drawer_by_name('LOGBOOK') is None
+    assert heading.get_drawer_by_name('NOTES').name == 'NOTES'
+    assert heading.clocking() == []
+
+def test_properties_drive_properties_drawer():
+    parsed = Org('* Heading\n:PROPERTIES:\n:ID:       x\n:END:\n', from_file=False)
+    heading = parsed.root.children[0]
+    heading.drawers[0].contents.append(':FOO:       bar')
+    assert str(heading) == '* Heading\n:PROPERTIES:\n:ID:       x\n:END:\n'
+    heading.properties['FOO'] = 'bar'
+    assert str(heading) == '* Heading\n:PROPERTIES:\n:ID:       x\n:FOO:       bar\n:END:\n'
+
+def test_removed_and_replaced_drawer():
+    parsed = Org('''* Heading
+:NOTES:
+:END:
+:LOGBOOK:
+CLOCK: [2023-07-23 Sun 10:00]--[2023-07-23 Sun 12:00] => 2:00
+:END:
+''', from_file=False)
+    heading = parsed.root.children[0]
+    assert heading.get_drawer_by_name('LOGBOOK') is not None
+    heading.drawers[1] = Drawer(':LOGBOOK:\nCLOCK: [2023-07-23 Sun 10:00]--[2023-07-23 Sun 11:00] => 1:00\n:END:')
+    assert heading.clocking() == [Clocking('2023-07-23 Sun 10:00', '2023-07-23 Sun 11:00')]
+    heading.drawers.pop()
+    assert heading.get_drawer_by_name('LOGBOOK') is None
+    assert heading.clocking() == []
@@ -0,0 +1,38 @@
+import pytest
+from orgmunge import Org
+
+def test_promote_tree():
+    parsed = Org('* A\n** B\n*** C\n**** X\n*** D\n** E\n', from_file=False)
+    b = parsed.root.children[0].children[0]
+    b.promote_tree()
+    assert str(parsed) == '* A\n* B\n** C\n*** X\n** D\n** E\n'
+    assert b.sibling is parsed.root.children[0]
+    assert b.children[-1].sibling is b.children[-2]
+    b.demote_tree()
+    assert str(parsed) == '* A\n** B\n*** C\n**** X\n*** D\n*** E\n'
+
+def test_demote_tree():
+    parsed = Org('* A\n** B\n*** C\n** E\n*** F\n*** G\n', from_file=False)
+    e = parsed.root.children[0].children[1]
+    e.demote_tree()
+    assert str(parsed) == '* A\n** B\n*** C\n*** E\n**** F\n**** G\n'
+    assert e.parent.title == 'B'
+
+def test_promote_top_level_heading():
+    text = '* A\n** B\n* C\n'
+    parsed = Org(text, from_file=False)
+    with pytest.raises(ValueError):
+        parsed.root.children[0].promote_tree()
+    with pytest.raises(ValueError):
+        parsed.root.children[1].promote()
+    assert str(parsed) == text
+
+def test_promote_tree_updates_next_sibling():
+    parsed = Org('* A\n** B\n*** C\n**** X\n*** D\n** E\n', from_file=False)
+    a = parsed.root.children[0]
+    c = a.children[0].children[0]
+    e = a.children[1]
+    c.promote_tree()
+    assert e.sibling is c
+    e.demote()
+    assert str(parsed) == '* A\n** B\n** C\n*** X\n*** D\n*** E\n'
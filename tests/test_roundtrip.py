@@ -54,3 +54,10 @@ def test_roundtrip_after_adding_child(todo_and_done_states):
     child_note = Org("* N2\n", from_file=False, todos=todo_and_done_states)
     parent_note.root.children[0].add_child(child_note.root)
     assert "* N1\n* N2\n" == str(parent_note)
+
+
+def test_roundtrip_empty_property():
+    text = "* H\n:PROPERTIES:\n:EMPTY:\n:ID:       x\n:END:\n"
+    parsed = Org(text, from_file=False)
+    assert parsed.root.children[0].properties == {"EMPTY": "", "ID": "x"}
+    assert str(parsed) == text